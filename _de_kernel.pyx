@@ -0,0 +1,83 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Versão compilada antecipadamente (Cython) do kernel de avaliação da evolução diferencial.
+Útil quando o Numba não está disponível ou o tempo de compilação JIT não é aceitável.
+
+Compilação no próprio diretório:
+    cythonize -i _de_kernel.pyx
+"""
+import numpy as np
+from cython cimport floating
+
+cdef enum:
+    TIPO_CIRCULAR = 1
+
+
+cdef inline bint overlap_rect(floating x1, floating y1, floating w1, floating h1,
+                              floating x2, floating y2, floating w2, floating h2) noexcept nogil:
+    return (x1 < x2 + w2) & (x2 < x1 + w1) & (y1 < y2 + h2) & (y2 < y1 + h1)
+
+
+cdef inline bint overlap_circ(floating x1, floating y1, floating r1,
+                              floating x2, floating y2, floating r2) noexcept nogil:
+    cdef floating dx = x1 - x2
+    cdef floating dy = y1 - y2
+    cdef floating rsum = r1 + r2
+    return dx * dx + dy * dy < rsum * rsum
+
+
+cdef inline bint overlap_circ_rect(floating xc, floating yc, floating r,
+                                   floating xr, floating yr, floating w, floating h) noexcept nogil:
+    # (xc, yc) é o centro do círculo, como em overlap_circ
+    cdef floating dx = xc - min(max(xc, xr), xr + w)
+    cdef floating dy = yc - min(max(yc, yr), yr + h)
+    return dx * dx + dy * dy < r * r
+
+
+def eval_batch(floating[:, ::1] X, floating[:, ::1] Y, floating[::1] W, floating[::1] H,
+               floating[::1] RR, signed char[::1] tipo, double sw, double sh,
+               long long penalty_overlap=50, bint check_circle_rect=False, out=None):
+    """
+    Mesmo cálculo de differential_evolution._eval_batch_numpy, percorrendo só
+    o triângulo superior de pares (i < j). Aceita coordenadas float32 ou float64.
+    :param out: Vetor int64 de forma (pop_size,) onde escrever as penalidades (opcional).
+    :return: Vetor de penalidades de forma (pop_size,).
+    """
+    cdef Py_ssize_t pop_size = X.shape[0]
+    cdef Py_ssize_t n = X.shape[1]
+    cdef Py_ssize_t p, i, j
+    cdef long long total
+    cdef floating xi, yi
+
+    if out is None:
+        out = np.zeros(pop_size, dtype=np.int64)
+    cdef long long[::1] penalty = out
+
+    with nogil:
+        for p in range(pop_size):
+            total = 0
+            for i in range(n):
+                xi = X[p, i]
+                yi = Y[p, i]
+                # Penaliza formas que saem da chapa
+                if xi < 0 or xi + W[i] > sw:
+                    total += 100
+                if yi < 0 or yi + H[i] > sh:
+                    total += 100
+
+                # Penaliza sobreposição entre formas, nas duas ordens do par
+                for j in range(i + 1, n):
+                    if tipo[i] == TIPO_CIRCULAR and tipo[j] == TIPO_CIRCULAR:
+                        if overlap_circ(xi, yi, RR[i], X[p, j], Y[p, j], RR[j]):
+                            total += 2 * penalty_overlap
+                    elif tipo[i] != TIPO_CIRCULAR and tipo[j] != TIPO_CIRCULAR:
+                        if overlap_rect(xi, yi, W[i], H[i], X[p, j], Y[p, j], W[j], H[j]):
+                            total += 2 * penalty_overlap
+                    elif check_circle_rect:
+                        if tipo[i] == TIPO_CIRCULAR:
+                            if overlap_circ_rect(xi, yi, RR[i], X[p, j], Y[p, j], W[j], H[j]):
+                                total += 2 * penalty_overlap
+                        elif overlap_circ_rect(X[p, j], Y[p, j], RR[j], xi, yi, W[i], H[i]):
+                            total += 2 * penalty_overlap
+            penalty[p] = total
+    return out
@@ -1,9 +1,178 @@
+import multiprocessing as mp
+import numbers
+import os
 import numpy as np
-import random
 import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
+from dataclasses import dataclass
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba é opcional; sem ele usa-se o kernel em NumPy.
+    njit = None
+
+# Códigos inteiros usados no vetor TIPO para identificar cada forma.
+TIPO_RETANGULAR = 0
+TIPO_CIRCULAR = 1
+TIPO_DIAMANTE = 2
+TIPO_TRIANGULAR = 3
+
+# Tipo dos arrays de coordenadas e dimensões. Posições numa chapa não precisam
+# de precisão dupla, e float32 reduz pela metade a memória lida na avaliação.
+COORD_DTYPE = np.float32
+
+# run(workers > 1) só usa o Pool sem o Numba (kernel NumPy ou Cython, que rodam
+# em um único núcleo) e a partir deste número de formas; abaixo disso o custo de
+# enviar as coordenadas aos processos supera o ganho do paralelismo.
+MIN_SHAPES_POOL = 100
+
+TIPO_CODES = {
+    'retangular': TIPO_RETANGULAR,
+    'circular': TIPO_CIRCULAR,
+    'diamante': TIPO_DIAMANTE,
+    'triangular': TIPO_TRIANGULAR,
+}
+
+
+@dataclass
+class Population:
+    """
+    População armazenada como estrutura de arrays (SoA).
+    Cada array tem forma (pop_size, n_shapes): a linha k guarda o indivíduo k.
+    """
+    X: np.ndarray
+    Y: np.ndarray
+    R: np.ndarray
+
+
+def _overlap_circle_rect(xc, yc, r, xr, yr, w, h):
+    """
+    Verifica se um círculo (centro (xc, yc), raio r) se sobrepõe a um retângulo
+    (canto (xr, yr), largura w, altura h). Como no teste círculo-círculo e em
+    plot_layout, (x, y) de um círculo é o seu centro.
+    Compara o quadrado da distância do centro ao ponto mais próximo do retângulo.
+    """
+    dx = xc - min(max(xc, xr), xr + w)
+    dy = yc - min(max(yc, yr), yr + h)
+    return dx * dx + dy * dy < r * r
+
+
+def _eval_batch_numpy(X, Y, W, H, RR, TIPO, sw, sh, penalty_overlap=50, check_circle_rect=False):
+    """
+    Avalia uma população penalizando sobreposição e formas fora da chapa.
+    As sobreposições são calculadas com broadcasting sobre um array (pop_size, n, n) de pares.
+    :param X: Coordenadas x, forma (pop_size, n_shapes).
+    :param Y: Coordenadas y, forma (pop_size, n_shapes).
+    :param penalty_overlap, check_circle_rect: Ver DifferentialEvolution.__init__.
+    :return: Vetor de penalidades de forma (pop_size,).
+    """
+    # Penaliza formas que saem da chapa
+    fora_x = (X < 0) | (X + W > sw)
+    fora_y = (Y < 0) | (Y + H > sh)
+    penalty = 100 * (np.count_nonzero(fora_x, axis=1) + np.count_nonzero(fora_y, axis=1))
+
+    # Penaliza sobreposição entre formas
+    circ = TIPO == TIPO_CIRCULAR
+    rect = ~circ
+    Xi, Xj = X[:, :, None], X[:, None, :]
+    Yi, Yj = Y[:, :, None], Y[:, None, :]
+    dx = Xi - Xj
+    dy = Yi - Yj
+    rsum = RR[:, None] + RR[None, :]
+    overlap_cc = (circ[:, None] & circ[None, :]) & (dx * dx + dy * dy < rsum * rsum)
+    overlap_rr = ((rect[:, None] & rect[None, :]) &
+                  (Xi < Xj + W[None, :]) & (Xj < Xi + W[:, None]) &
+                  (Yi < Yj + H[None, :]) & (Yj < Yi + H[:, None]))
+    overlap = overlap_cc | overlap_rr
+    if check_circle_rect:
+        # Pares (círculo i, retângulo j), espelhados para cobrir também (retângulo i, círculo j)
+        ddx = Xi - np.minimum(np.maximum(Xi, Xj), Xj + W[None, :])
+        ddy = Yi - np.minimum(np.maximum(Yi, Yj), Yj + H[None, :])
+        overlap_cr = (circ[:, None] & rect[None, :]) & (ddx * ddx + ddy * ddy < (RR * RR)[:, None])
+        overlap |= overlap_cr | overlap_cr.transpose(0, 2, 1)
+    overlap = np.triu(overlap, 1)
+    # Cada par (i, j) é penalizado nas duas ordens, como na versão com laços.
+    penalty += 2 * penalty_overlap * np.count_nonzero(overlap, axis=(1, 2))
+
+    return penalty
+
+
+if njit is not None:
+    _overlap_circle_rect_jit = njit(cache=True, fastmath=True)(_overlap_circle_rect)
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def eval_batch(X, Y, W, H, RR, TIPO, sw, sh, penalty_overlap=50, check_circle_rect=False):
+        """
+        Mesmo cálculo de _eval_batch_numpy, compilado pelo Numba e paralelizado
+        sobre os indivíduos. Percorre só o triângulo superior de pares (i < j).
+        """
+        pop_size, n = X.shape
+        penalty = np.zeros(pop_size, dtype=np.int64)
+        for p in prange(pop_size):
+            total = 0
+            for i in range(n):
+                xi = X[p, i]
+                yi = Y[p, i]
+                # Penaliza formas que saem da chapa
+                if xi < 0 or xi + W[i] > sw:
+                    total += 100
+                if yi < 0 or yi + H[i] > sh:
+                    total += 100
+
+                # Penaliza sobreposição entre formas, nas duas ordens do par
+                for j in range(i + 1, n):
+                    xj = X[p, j]
+                    yj = Y[p, j]
+                    if TIPO[i] == TIPO_CIRCULAR and TIPO[j] == TIPO_CIRCULAR:
+                        dx = xi - xj
+                        dy = yi - yj
+                        rsum = RR[i] + RR[j]
+                        if dx * dx + dy * dy < rsum * rsum:
+                            total += 2 * penalty_overlap
+                    elif TIPO[i] != TIPO_CIRCULAR and TIPO[j] != TIPO_CIRCULAR:
+                        if (xi < xj + W[j]) & (xj < xi + W[i]) & (yi < yj + H[j]) & (yj < yi + H[i]):
+                            total += 2 * penalty_overlap
+                    elif check_circle_rect:
+                        if TIPO[i] == TIPO_CIRCULAR:
+                            hit = _overlap_circle_rect_jit(xi, yi, RR[i], xj, yj, W[j], H[j])
+                        else:
+                            hit = _overlap_circle_rect_jit(xj, yj, RR[j], xi, yi, W[i], H[i])
+                        if hit:
+                            total += 2 * penalty_overlap
+            penalty[p] = total
+        return penalty
+else:
+    try:
+        # Kernel compilado com Cython (cythonize -i _de_kernel.pyx), se disponível.
+        from _de_kernel import eval_batch
+    except ImportError:
+        eval_batch = _eval_batch_numpy
+
+
+# Dados estáticos das formas em cada processo do Pool, definidos por _init_worker.
+_worker_static = None
+
+
+def _init_worker(static):
+    """
+    Inicializa um processo do Pool com os dados estáticos das formas,
+    enviados uma única vez em vez de a cada geração.
+    """
+    global _worker_static
+    _worker_static = static
+
+
+def _eval_chunk(chunk):
+    """
+    Avalia um bloco (X, Y) da população dentro de um processo do Pool.
+    """
+    X, Y = chunk
+    return eval_batch(X, Y, *_worker_static)
+
 
 class DifferentialEvolution:
-    def __init__(self, pop_size, max_iter, sheet_width, sheet_height, recortes_disponiveis):
+    def __init__(self, pop_size, max_iter, sheet_width, sheet_height, recortes_disponiveis, seed=None,
+                 penalty_overlap=50, check_circle_rect=False):
         """
         Inicializa a classe DifferentialEvolution.
         :param pop_size: Tamanho da população.
@@ -11,111 +180,216 @@ class DifferentialEvolution:
         :param sheet_width: Largura da chapa.
         :param sheet_height: Altura da chapa.
         :param recortes_disponiveis: Lista de formas geométricas disponíveis.
+        :param seed: Semente do gerador de números aleatórios (opcional).
+        :param penalty_overlap: Penalidade inteira por sobreposição, aplicada em cada ordem do par.
+        :param check_circle_rect: Se True, também penaliza sobreposição entre círculos e
+                                  as demais formas (por padrão só círculo-círculo e
+                                  retângulo-retângulo são testados).
         """
+        if pop_size < 4:
+            raise ValueError("pop_size deve ser pelo menos 4: a mutação usa três indivíduos além do alvo.")
+        if not isinstance(penalty_overlap, numbers.Integral):
+            raise ValueError("penalty_overlap deve ser um inteiro: as penalidades são acumuladas em int64.")
         self.pop_size = pop_size
         self.max_iter = max_iter
         self.sheet_width = sheet_width
         self.sheet_height = sheet_height
         self.recortes_disponiveis = recortes_disponiveis
+        self.penalty_overlap = penalty_overlap
+        self.check_circle_rect = check_circle_rect
+        self.rng = np.random.default_rng(seed)
+
+        # Dados estáticos de cada forma, compartilhados por todos os indivíduos.
+        # W e H são as extensões da forma (largura/altura, ou 2r para círculos),
+        # calculadas uma única vez aqui em vez de a cada avaliação ou mutação.
+        self.W = np.array([r.get('largura', r.get('r', 0) * 2) for r in recortes_disponiveis], dtype=COORD_DTYPE)
+        self.H = np.array([r.get('altura', r.get('r', 0) * 2) for r in recortes_disponiveis], dtype=COORD_DTYPE)
+        self.RR = np.array([r.get('r', 0) for r in recortes_disponiveis], dtype=COORD_DTYPE)
+        self.TIPO = np.array([TIPO_CODES.get(r['tipo'], TIPO_RETANGULAR) for r in recortes_disponiveis], dtype=np.int8)
+        self.R0 = np.array([r.get('rotacao', 0) for r in recortes_disponiveis], dtype=COORD_DTYPE)
+        # Maior coordenada permitida para cada forma continuar dentro da chapa.
+        self.bounds_x = self.sheet_width - self.W
+        self.bounds_y = self.sheet_height - self.H
+
+        # Pool de processos usado por evaluate_batch durante run(workers > 1).
+        self._pool = None
+        self._workers = 1
+
         self.population = self.initialize_population()
+        # Buffers da população de teste, reaproveitados a cada geração por _step().
+        self._buf_x = np.empty_like(self.population.X)
+        self._buf_y = np.empty_like(self.population.Y)
+        self._buf_r = np.empty_like(self.population.R)
+        # Penalidade de cada indivíduo, mantida em dia por select().
+        self.fitness = self.evaluate_batch(self.population.X, self.population.Y)
 
     def initialize_population(self):
         """
         Inicializa a população com posições aleatórias dentro da chapa.
         """
-        population = []
-        for _ in range(self.pop_size):
-            individual = []
-            for recorte in self.recortes_disponiveis:
-                new_x = random.uniform(0, self.sheet_width - recorte.get('largura', recorte.get('r', 0) * 2))
-                new_y = random.uniform(0, self.sheet_height - recorte.get('altura', recorte.get('r', 0) * 2))
-                new_rotation = random.choice([0, 90])  # Define rotação aleatória
-                individual.append({**recorte, "x": new_x, "y": new_y, "rotacao": new_rotation})
-            population.append(individual)
-        return population
-    
-    def evaluate(self, candidate):
+        shape = (self.pop_size, len(self.recortes_disponiveis))
+        X = self.rng.uniform(0, self.bounds_x, shape).astype(COORD_DTYPE)
+        Y = self.rng.uniform(0, self.bounds_y, shape).astype(COORD_DTYPE)
+        R = self.rng.choice(np.array([0, 90], dtype=COORD_DTYPE), shape)  # Define rotação aleatória
+        return Population(X, Y, R)
+
+    def evaluate(self, x, y):
         """
         Avalia um indivíduo penalizando sobreposição e formas fora da chapa.
+        :param x: Coordenadas x das formas do indivíduo, forma (n_shapes,).
+        :param y: Coordenadas y das formas do indivíduo, forma (n_shapes,).
         """
-        penalty = 0
-        for i, shape in enumerate(candidate):
-            # Penaliza formas que saem da chapa
-            if shape['x'] < 0 or shape['x'] + shape.get('largura', shape.get('r', 0) * 2) > self.sheet_width:
-                penalty += 100  
-            if shape['y'] < 0 or shape['y'] + shape.get('altura', shape.get('r', 0) * 2) > self.sheet_height:
-                penalty += 100  
-            
-            # Penaliza sobreposição entre formas
-            for j, other in enumerate(candidate):
-                if i != j and self.overlaps(shape, other):
-                    penalty += 50  
-        
-        return penalty
-    
-    def overlaps(self, shape1, shape2):
+        return self.evaluate_batch(x[None, :], y[None, :])[0]
+
+    def evaluate_batch(self, X, Y):
         """
-        Verifica se duas formas geométricas se sobrepõem.
+        Avalia todos os indivíduos de uma vez, penalizando sobreposição e formas fora da chapa.
+        :param X: Coordenadas x, forma (pop_size, n_shapes).
+        :param Y: Coordenadas y, forma (pop_size, n_shapes).
+        :return: Vetor de penalidades de forma (pop_size,).
         """
-        if shape1['tipo'] == 'circular' and shape2['tipo'] == 'circular':
-            distance = np.sqrt((shape1['x'] - shape2['x'])**2 + (shape1['y'] - shape2['y'])**2)
-            return distance < (shape1['r'] + shape2['r'])
-        
-        if shape1['tipo'] != 'circular' and shape2['tipo'] != 'circular':
-            return not (shape1['x'] + shape1['largura'] <= shape2['x'] or
-                        shape2['x'] + shape2['largura'] <= shape1['x'] or
-                        shape1['y'] + shape1['altura'] <= shape2['y'] or
-                        shape2['y'] + shape2['altura'] <= shape1['y'])
-        
+        X = np.ascontiguousarray(X, dtype=COORD_DTYPE)
+        Y = np.ascontiguousarray(Y, dtype=COORD_DTYPE)
+        if self._pool is not None:
+            # Divide a população em blocos de linhas, um por processo.
+            chunks = zip(np.array_split(X, self._workers), np.array_split(Y, self._workers))
+            return np.concatenate(self._pool.map(_eval_chunk, chunks))
+        return eval_batch(X, Y, self.W, self.H, self.RR, self.TIPO, self.sheet_width, self.sheet_height,
+                          self.penalty_overlap, self.check_circle_rect)
+
+    def overlaps(self, x, y, i, j):
+        """
+        Verifica se as formas i e j de um indivíduo se sobrepõem.
+        """
+        if self.TIPO[i] == TIPO_CIRCULAR and self.TIPO[j] == TIPO_CIRCULAR:
+            # Compara distâncias ao quadrado para evitar a raiz quadrada
+            d2 = (x[i] - x[j])**2 + (y[i] - y[j])**2
+            rsum = self.RR[i] + self.RR[j]
+            return d2 < rsum * rsum
+
+        if self.TIPO[i] != TIPO_CIRCULAR and self.TIPO[j] != TIPO_CIRCULAR:
+            # Teste AABB sem desvios: comparações combinadas com & em vez de or/not
+            return ((x[i] < x[j] + self.W[j]) & (x[j] < x[i] + self.W[i]) &
+                    (y[i] < y[j] + self.H[j]) & (y[j] < y[i] + self.H[i]))
+
+        if self.check_circle_rect:
+            c, r = (i, j) if self.TIPO[i] == TIPO_CIRCULAR else (j, i)
+            return _overlap_circle_rect(x[c], y[c], self.RR[c], x[r], y[r], self.W[r], self.H[r])
+
         return False
-    
-    def mutate(self, target_index):
+
+    def mutate(self, out=None):
         """
-        Realiza a mutação para criar um indivíduo mutante baseado em três outros indivíduos.
+        Realiza a mutação de toda a população de uma vez: o mutante k é baseado em
+        três outros indivíduos distintos a, b e c, todos diferentes de k.
+        :param out: Tupla (X, Y, R) de arrays onde escrever o mutante (opcional).
+        Retorna a tupla (X, Y, R) com a população mutante.
         """
-        idxs = [idx for idx in range(self.pop_size) if idx != target_index]
-        a, b, c = random.sample(idxs, 3)
-        mutant = []
-        for i in range(len(self.recortes_disponiveis)):
-            new_x = min(max(self.population[a][i]['x'] + 0.8 * (self.population[b][i]['x'] - self.population[c][i]['x']), 0), self.sheet_width - self.recortes_disponiveis[i].get('largura', self.recortes_disponiveis[i].get('r', 0) * 2))
-            new_y = min(max(self.population[a][i]['y'] + 0.8 * (self.population[b][i]['y'] - self.population[c][i]['y']), 0), self.sheet_height - self.recortes_disponiveis[i].get('altura', self.recortes_disponiveis[i].get('r', 0) * 2))
-            mutant.append({**self.recortes_disponiveis[i], "x": new_x, "y": new_y})
-        return mutant
-    
+        # Sorteia (a, b, c) para todos os indivíduos e ressorteia apenas as linhas
+        # inválidas (índice repetido ou igual ao próprio indivíduo), que são raras.
+        own = np.arange(self.pop_size)[:, None]
+        idx = self.rng.integers(0, self.pop_size, size=(self.pop_size, 3))
+        while True:
+            bad = ((idx == own).any(axis=1) | (idx[:, 0] == idx[:, 1]) |
+                   (idx[:, 0] == idx[:, 2]) | (idx[:, 1] == idx[:, 2]))
+            if not bad.any():
+                break
+            idx[bad] = self.rng.integers(0, self.pop_size, size=(np.count_nonzero(bad), 3))
+        a, b, c = idx[:, 0], idx[:, 1], idx[:, 2]
+
+        P = self.population
+        if out is None:
+            out = (np.empty_like(P.X), np.empty_like(P.Y), np.empty_like(P.R))
+        new_x, new_y, new_rotation = out
+        for new, V, bounds in ((new_x, P.X, self.bounds_x), (new_y, P.Y, self.bounds_y)):
+            # new = clip(V[a] + 0.8 * (V[b] - V[c]), 0, bounds), escrito no próprio buffer
+            np.subtract(V[b], V[c], out=new)
+            new *= 0.8
+            new += V[a]
+            np.clip(new, 0, bounds, out=new)
+        new_rotation[...] = self.R0
+        return out
+
     def crossover(self, target, mutant):
         """
-        Realiza o cruzamento entre um indivíduo alvo e o mutante.
+        Realiza o cruzamento entre a população alvo e a mutante.
+        Ambas são tuplas (X, Y, R); cada forma vem do mutante com probabilidade 0.9.
+        O resultado é escrito nos próprios arrays do mutante, que são retornados.
         """
-        trial = []
-        for i in range(len(target)):
-            if random.random() < 0.9:
-                trial.append(mutant[i])
-            else:
-                trial.append(target[i])
-        return trial
-    
-    def select(self, target, trial):
+        keep = self.rng.random(target[0].shape) >= 0.9
+        for t, m in zip(target, mutant):
+            np.copyto(m, t, where=keep)
+        return mutant
+
+    def select(self, trial, trial_fit):
         """
-        Seleciona o indivíduo com menor penalidade.
+        Substitui cada indivíduo pelo seu teste quando este tem menor penalidade.
+        Só as posições aceitas de self.fitness mudam; nada é reavaliado.
+        :param trial: Tupla (X, Y, R) com a população de teste.
+        :param trial_fit: Penalidades da população de teste, forma (pop_size,).
         """
-        if self.evaluate(trial) < self.evaluate(target):
-            return trial
-        return target
-    
-    def run(self):
+        P = self.population
+        mask = trial_fit < self.fitness
+        P.X[mask] = trial[0][mask]
+        P.Y[mask] = trial[1][mask]
+        P.R[mask] = trial[2][mask]
+        self.fitness[mask] = trial_fit[mask]
+
+    def _step(self):
+        """
+        Executa uma geração completa: mutação, cruzamento, avaliação e seleção.
+        A população de teste é montada nos buffers preallocados e a população
+        é atualizada no lugar, sem alocar uma nova a cada geração.
+        """
+        P = self.population
+        trial = self.mutate(out=(self._buf_x, self._buf_y, self._buf_r))
+        trial = self.crossover((P.X, P.Y, P.R), trial)
+        self.select(trial, self.evaluate_batch(trial[0], trial[1]))
+
+    def run(self, workers=1):
         """
         Executa a otimização por evolução diferencial.
+        Cada geração faz uma única avaliação em lote da população de teste, e a
+        execução termina antes de max_iter se algum layout atingir penalidade zero.
+        :param workers: Número de processos para avaliar a população. É ignorado (avaliação
+                        em série) com o Numba, que já paraleliza o kernel em threads, com
+                        menos de MIN_SHAPES_POOL formas ou com um único núcleo disponível.
         """
-        for _ in range(self.max_iter):
-            new_population = []
-            for i in range(self.pop_size):
-                mutant = self.mutate(i)
-                trial = self.crossover(self.population[i], mutant)
-                new_population.append(self.select(self.population[i], trial))
-            self.population = new_population
-        return min(self.population, key=self.evaluate)
+        pool = None
+        workers = min(workers, os.cpu_count() or 1)
+        if njit is None and workers > 1 and len(self.recortes_disponiveis) >= MIN_SHAPES_POOL:
+            static = (self.W, self.H, self.RR, self.TIPO, self.sheet_width, self.sheet_height,
+                      self.penalty_overlap, self.check_circle_rect)
+            pool = mp.Pool(workers, initializer=_init_worker, initargs=(static,))
+            self._pool, self._workers = pool, workers
+        best_idx = int(np.argmin(self.fitness))
+        best_fit = self.fitness[best_idx]
+        try:
+            for _ in range(self.max_iter):
+                # Penalidade zero é o ótimo global: nada a melhorar.
+                if best_fit == 0:
+                    break
+                self._step()
+                cand = self.fitness.min()
+                if cand < best_fit:
+                    best_idx = int(np.argmin(self.fitness))
+                    best_fit = cand
+        finally:
+            self._pool, self._workers = None, 1
+            if pool is not None:
+                pool.close()
+                pool.join()
+        P = self.population
+        return self._to_dicts(P.X[best_idx], P.Y[best_idx], P.R[best_idx])
+
+    def _to_dicts(self, x, y, rotation):
+        """
+        Converte um indivíduo em arrays para a lista de dicionários usada por plot_layout.
+        """
+        return [{**recorte, "x": float(x[i]), "y": float(y[i]), "rotacao": float(rotation[i])}
+                for i, recorte in enumerate(self.recortes_disponiveis)]
     
-    def plot_layout(self, layout):
+    def plot_layout(self, layout, x_arr=None, y_arr=None):
         """
         Plota o layout otimizado das formas geométricas dentro da chapa.
 
@@ -126,6 +400,9 @@ class DifferentialEvolution:
         - Diamantes são desenhados em verde.
         - Mantém a proporção do gráfico ajustada para melhor visualização.
         - Exibe o gráfico com o layout final das formas.
+
+        Se x_arr e y_arr forem dados, `layout` é usado apenas como modelo (tipo e
+        dimensões de cada forma) e as posições vêm desses arrays, sem criar dicionários.
         """
 
         fig, ax = plt.subplots()
@@ -133,28 +410,33 @@ class DifferentialEvolution:
         ax.set_ylim(0, self.sheet_height)
         ax.set_title("Layout Otimizado")
         
-        for shape in layout:
+        # Todas as formas vão para uma única PatchCollection: um artista só, em vez de um por forma.
+        shapes, colors = [], []
+        for i, shape in enumerate(layout):
+            x = shape['x'] if x_arr is None else x_arr[i]
+            y = shape['y'] if y_arr is None else y_arr[i]
             if shape['tipo'] == 'retangular':
-                rect = plt.Rectangle((shape['x'], shape['y']), shape['largura'], shape['altura'], edgecolor='b', facecolor='none')
-                ax.add_patch(rect)
+                shapes.append(plt.Rectangle((x, y), shape['largura'], shape['altura']))
+                colors.append('b')
             elif shape['tipo'] == 'circular':
-                circ = plt.Circle((shape['x'], shape['y']), shape['r'], edgecolor='r', facecolor='none')
-                ax.add_patch(circ)
+                shapes.append(plt.Circle((x, y), shape['r']))
+                colors.append('r')
             elif shape['tipo'] == 'diamante':
-                x, y = shape['x'], shape['y']
                 width, height = shape['largura'], shape['altura']
-                diamond = plt.Polygon([[x, y + height / 2], [x + width / 2, y], [x, y - height / 2], [x - width / 2, y]], edgecolor='g', facecolor='none')
-                ax.add_patch(diamond)
+                shapes.append(plt.Polygon([[x, y + height / 2], [x + width / 2, y], [x, y - height / 2], [x - width / 2, y]]))
+                colors.append('g')
+        ax.add_collection(PatchCollection(shapes, facecolor='none', edgecolors=colors))
         
         plt.gca().set_aspect('equal', adjustable='box')
         plt.show()
     
-    def optimize_and_display(self):
+    def optimize_and_display(self, workers=1):
         """
         Executa a otimização e exibe o layout final das formas na chapa.
+        :param workers: Número de processos repassado a run().
         """
         print("Executando otimização com Evolução Diferencial...")
-        self.optimized_layout = self.run()
+        self.optimized_layout = self.run(workers=workers)
         print("Otimização concluída.")
         self.plot_layout(self.optimized_layout)
         return self.optimized_layout
\ No newline at end of file